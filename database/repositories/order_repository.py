@@ -129,6 +129,25 @@ class OrderRepository:
         result = await self.session.execute(query)
         return result.scalars().all()
 
+    async def get_active_orders_by_connector(self, account_name: str,
+                                             limit_per_connector: int = 1000) -> Dict[str, List[Order]]:
+        """Get active orders (SUBMITTED, OPEN, PARTIALLY_FILLED) for an account in a single query, grouped by connector.
+
+        Keeps the most recent limit_per_connector orders of each connector, the same cap get_active_orders applies.
+        """
+        query = select(Order).where(
+            Order.status.in_(["SUBMITTED", "OPEN", "PARTIALLY_FILLED"]),
+            Order.account_name == account_name
+        ).order_by(Order.created_at.desc())
+
+        result = await self.session.execute(query)
+        orders_by_connector: Dict[str, List[Order]] = {}
+        for order in result.scalars().all():
+            connector_orders = orders_by_connector.setdefault(order.connector_name, [])
+            if len(connector_orders) < limit_per_connector:
+                connector_orders.append(order)
+        return orders_by_connector
+
     async def get_orders_summary(self, account_name: Optional[str] = None,
                                start_time: Optional[int] = None,
                                end_time: Optional[int] = None) -> Dict:
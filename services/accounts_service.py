@@ -178,26 +178,15 @@ class AccountsService:
         """
         Check all available credentials for all accounts and ensure connectors are initialized.
         This method is idempotent - it only initializes missing connectors.
-        """
-        for account_name in self.list_accounts():
-            await self._ensure_account_connectors_initialized(account_name)
-
-    async def _ensure_account_connectors_initialized(self, account_name: str):
-        """
-        Ensure all connectors for a specific account are initialized.
-        This delegates to ConnectorManager for actual initialization.
-        
-        :param account_name: The name of the account to initialize connectors for.
-        """
-        # Initialize missing connectors
-        for connector_name in self.connector_manager.list_available_credentials(account_name):
-            try:
-                # Only initialize if connector doesn't exist
-                if not self.connector_manager.is_connector_initialized(account_name, connector_name):
-                    # Get connector will now handle all initialization
-                    await self.connector_manager.get_connector(account_name, connector_name)
-            except Exception as e:
-                logger.error(f"Error initializing connector {connector_name} for account {account_name}: {e}")
+        Runs on startup as the first iteration of the update loop, pre-warming the connector cache.
+        """
+        credentials_by_account = await self.connector_manager.list_credentials_for_accounts(self.list_accounts())
+        missing_connectors = [(account_name, connector_name)
+                              for account_name, connector_names in credentials_by_account.items()
+                              for connector_name in connector_names
+                              if not self.connector_manager.is_connector_initialized(account_name, connector_name)]
+        # ConnectorManager initializes the missing connectors concurrently
+        await self.connector_manager.warm_up(missing_connectors)
 
     def _initialize_rate_sources_for_pairs(self, connector_name: str, trading_pairs: List[str]):
         """
@@ -390,8 +379,7 @@ class AccountsService:
         :return: List of credentials.
         """
         try:
-            return [file for file in fs_util.list_files(f'credentials/{account_name}/connectors') if
-                    file.endswith('.yml')]
+            return [f"{connector_name}.yml" for connector_name in fs_util.discover_credentials(account_name)]
         except FileNotFoundError as e:
             raise HTTPException(status_code=404, detail=str(e))
 
@@ -404,6 +392,7 @@ class AccountsService:
         """
         if fs_util.path_exists(f"credentials/{account_name}/connectors/{connector_name}.yml"):
             fs_util.delete_file(directory=f"credentials/{account_name}/connectors", file_name=f"{connector_name}.yml")
+            self.connector_manager.invalidate_credentials_cache(account_name)
             
             # Stop the connector if it's running
             await self.connector_manager.stop_connector(account_name, connector_name)
@@ -428,6 +417,7 @@ class AccountsService:
         files_to_copy = ["conf_client.yml", "conf_fee_overrides.yml", "hummingbot_logs.yml", ".password_verification"]
         fs_util.create_folder('credentials', account_name)
         fs_util.create_folder(f'credentials/{account_name}', "connectors")
+        self.connector_manager.invalidate_credentials_cache(account_name)
         for file in files_to_copy:
             fs_util.copy_file(f"credentials/master_account/{file}", f"credentials/{account_name}/{file}")
         
@@ -446,6 +436,7 @@ class AccountsService:
         
         # Delete account folder
         fs_util.delete_folder('credentials', account_name)
+        self.connector_manager.invalidate_credentials_cache(account_name)
         
         # Remove from account state
         if account_name in self.accounts_state:
@@ -998,7 +989,7 @@ class AccountsService:
             raise HTTPException(status_code=404, detail=f"Account '{account_name}' not found")
         
         # Check if connector credentials exist
-        available_credentials = self.connector_manager.list_available_credentials(account_name)
+        available_credentials = await self.connector_manager.list_available_credentials(account_name)
         if connector_name not in available_credentials:
             raise HTTPException(status_code=404, detail=f"Connector '{connector_name}' not found for account '{account_name}'")
         
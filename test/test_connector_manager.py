@@ -0,0 +1,93 @@
+import asyncio
+import unittest
+
+try:
+    from utils.connector_manager import ConnectorKey, ConnectorManager
+except ImportError as e:  # hummingbot is only available in the full build environment
+    raise unittest.SkipTest(f"connector manager dependencies are not installed: {e}")
+
+
+class FakeConnector:
+    """Connector exposing only the network loops started by the connector manager."""
+
+    def __init__(self):
+        self._trading_rules_polling_task = None
+        self._trading_fees_polling_task = None
+        self._status_polling_task = None
+        self._user_stream_tracker_task = None
+        self._user_stream_event_listener_task = None
+        self._lost_orders_update_task = None
+
+    @staticmethod
+    async def _run_forever():
+        await asyncio.Event().wait()
+
+    def _trading_rules_polling_loop(self):
+        return self._run_forever()
+
+    def _trading_fees_polling_loop(self):
+        return self._run_forever()
+
+    def _user_stream_event_listener(self):
+        return self._run_forever()
+
+    def _lost_orders_update_polling_loop(self):
+        return self._run_forever()
+
+    def _create_user_stream_tracker_task(self):
+        return asyncio.ensure_future(self._run_forever())
+
+
+class TestConnectorManager(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.manager = ConnectorManager(secrets_manager=None)
+
+    async def test_concurrent_get_connector_creates_once(self):
+        created = []
+
+        async def create_and_initialize(account_name, connector_name, preloaded_orders=None):
+            created.append(connector_name)
+            await asyncio.sleep(0.01)
+            connector = FakeConnector()
+            self.manager._connector_cache[ConnectorKey(account_name, connector_name)] = connector
+            return connector
+
+        self.manager._create_and_initialize_connector = create_and_initialize
+
+        connectors = await asyncio.gather(*(self.manager.get_connector("a", "kucoin") for _ in range(5)))
+
+        self.assertEqual(["kucoin"], created)
+        self.assertTrue(all(connector is connectors[0] for connector in connectors))
+        self.assertEqual({}, self.manager._pending_creations)
+
+    async def test_stop_all_connectors_cancels_pending_creations(self):
+        connector = FakeConnector()
+        network_started = asyncio.Event()
+
+        async def create_connector(account_name, connector_name):
+            return connector
+
+        async def initialize(connector, account_name, connector_name, preloaded_orders=None):
+            await self.manager._start_connector_network(connector)
+            network_started.set()
+            await asyncio.sleep(0.05)
+
+        self.manager._create_connector = create_connector
+        self.manager._initialize_regular_connector = initialize
+
+        warm_up = asyncio.create_task(self.manager.warm_up([ConnectorKey("a", "kucoin")]))
+        await network_started.wait()
+        warm_up.cancel()
+        await asyncio.gather(warm_up, return_exceptions=True)
+
+        await self.manager.stop_all_connectors()
+        await asyncio.sleep(0.1)
+
+        self.assertEqual({}, self.manager._connector_cache)
+        self.assertEqual({}, self.manager._pending_creations)
+        self.assertIsNone(connector._user_stream_tracker_task)
+        self.assertEqual(set(), {task for task in self.manager._background_tasks if not task.done()})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,9 @@
 import asyncio
+import functools
 import logging
 import time
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Awaitable, Dict, List, NamedTuple, Optional, Set, Tuple
 
 # Create module-specific logger
 logger = logging.getLogger(__name__)
@@ -22,6 +23,67 @@ from utils.hummingbot_api_config_adapter import HummingbotAPIConfigAdapter
 from utils.security import BackendAPISecurity
 
 
+class ConnectorKey(NamedTuple):
+    """Cache key identifying a connector instance."""
+    account: str
+    connector: str
+
+
+# Map database order status to OrderState
+_ORDER_STATUS_MAP = {
+    "SUBMITTED": OrderState.PENDING_CREATE,
+    "OPEN": OrderState.OPEN,
+    "PARTIALLY_FILLED": OrderState.PARTIALLY_FILLED,
+    "FILLED": OrderState.FILLED,
+    "CANCELLED": OrderState.CANCELED,
+    "FAILED": OrderState.FAILED,
+}
+# Map database enum names to enum instances
+_ORDER_TYPE_MAP = {name: member for name, member in OrderType.__members__.items()}
+_TRADE_TYPE_MAP = {name: member for name, member in TradeType.__members__.items()}
+
+# Config keys of the connectors whose credentials can be swapped into a running instance,
+# mapped to the connector attributes their authenticator is built from
+_HOT_SWAP_KEY_ATTRIBUTES = {
+    "binance": {
+        "binance_api_key": "api_key",
+        "binance_api_secret": "secret_key",
+    },
+    "binance_perpetual": {
+        "binance_perpetual_api_key": "binance_perpetual_api_key",
+        "binance_perpetual_api_secret": "binance_perpetual_secret_key",
+    },
+}
+
+_CONNECTOR_CLASS_CACHE: Dict[str, type] = {}
+
+
+def _get_connector_class_cached(connector_name: str) -> type:
+    """Resolve the connector class once per connector name."""
+    connector_class = _CONNECTOR_CLASS_CACHE.get(connector_name)
+    if connector_class is None:
+        connector_class = _CONNECTOR_CLASS_CACHE[connector_name] = get_connector_class(connector_name)
+    return connector_class
+
+
+@functools.lru_cache(maxsize=None)
+def _is_perpetual(connector_name: str) -> bool:
+    """Whether the connector trades perpetual contracts (positions, position mode and funding payments)."""
+    return "_perpetual" in connector_name
+
+
+@functools.lru_cache(maxsize=None)
+def _conn_settings_for(connector_name: str):
+    """Cached AllConnectorSettings lookup, static for the lifetime of the process."""
+    return AllConnectorSettings.get_connector_settings()[connector_name]
+
+
+@functools.lru_cache(maxsize=None)
+def _conn_config_keys_for(connector_name: str):
+    """Cached connector config keys lookup, invalidated when connector keys are updated."""
+    return AllConnectorSettings.get_connector_config_keys(connector_name)
+
+
 class ConnectorManager:
     """
     Manages the creation and caching of exchange connectors.
@@ -29,15 +91,38 @@ class ConnectorManager:
     This is the single source of truth for all connector instances.
     """
 
-    def __init__(self, secrets_manager: ETHKeyFileSecretManger, db_manager=None):
+    def __init__(self,
+                 secrets_manager: ETHKeyFileSecretManger,
+                 db_manager=None,
+                 max_concurrent_stops: int = 32):
+        """
+        Initialize the ConnectorManager.
+
+        Args:
+            secrets_manager: Secrets manager used to decrypt connector credentials
+            db_manager: Database manager for order and funding recording (optional)
+            max_concurrent_stops: Maximum number of connectors stopped at the same time on shutdown (default: 32)
+        """
         self.secrets_manager = secrets_manager
         self.db_manager = db_manager
-        self._connector_cache: Dict[str, ConnectorBase] = {}
-        self._orders_recorders: Dict[str, any] = {}
-        self._funding_recorders: Dict[str, any] = {}
-        self._status_polling_tasks: Dict[str, asyncio.Task] = {}
-
-    async def get_connector(self, account_name: str, connector_name: str):
+        self.max_concurrent_stops = max_concurrent_stops
+        # BackendAPISecurity keeps the decrypted credentials in class-level state, so logins, key updates and
+        # decryption, which run in threads, must not interleave with each other or with a connector creation reading them
+        self._security_lock = asyncio.Lock()
+        # Account whose credentials are currently decrypted in BackendAPISecurity, as (account_name, id(secrets_manager))
+        self._logged_in: Optional[Tuple[str, int]] = None
+        # Strong references to background tasks so they can't be garbage collected while running
+        self._background_tasks: Set[asyncio.Task] = set()
+        self._connector_cache: Dict[ConnectorKey, ConnectorBase] = {}
+        # Secondary index of the connector cache grouped by account
+        self._by_account: Dict[str, Dict[str, ConnectorBase]] = {}
+        self._orders_recorders: Dict[ConnectorKey, any] = {}
+        self._funding_recorders: Dict[ConnectorKey, any] = {}
+        self._status_polling_tasks: Dict[ConnectorKey, asyncio.Task] = {}
+        # In-flight creations, so concurrent get_connector calls for the same key share a single initialization
+        self._pending_creations: Dict[ConnectorKey, asyncio.Task] = {}
+
+    async def get_connector(self, account_name: str, connector_name: str, preloaded_orders: Optional[List] = None):
         """
         Get the connector object for the specified account and connector.
         Uses caching to avoid recreating connectors unnecessarily.
@@ -45,18 +130,85 @@ class ConnectorManager:
 
         :param account_name: The name of the account.
         :param connector_name: The name of the connector.
+        :param preloaded_orders: Active order records already fetched from the database, used instead of
+            querying them again if the connector needs to be created.
         :return: The connector object.
         """
-        cache_key = f"{account_name}:{connector_name}"
+        cache_key = ConnectorKey(account_name, connector_name)
+        connector = self._connector_cache.get(cache_key)
+        if connector is not None:
+            return connector
+
+        creation = self._pending_creations.get(cache_key)
+        if creation is None:
+            # Create connector with full initialization. Registered before any await, so every
+            # concurrent caller for this key waits on the same creation instead of starting another.
+            creation = asyncio.create_task(
+                self._create_and_initialize_connector(account_name, connector_name, preloaded_orders))
+            self._pending_creations[cache_key] = creation
+            creation.add_done_callback(functools.partial(self._on_creation_done, cache_key))
+
+        # Shielded so that a cancelled caller doesn't abort the creation other callers are waiting on
+        return await asyncio.shield(creation)
+
+    def _on_creation_done(self, cache_key: ConnectorKey, creation: asyncio.Task):
+        """
+        Unregister a finished connector creation so that a failed one can be retried by the next caller.
 
-        if cache_key in self._connector_cache:
-            return self._connector_cache[cache_key]
+        :param cache_key: The key of the connector that was being created.
+        :param creation: The finished creation task.
+        """
+        if self._pending_creations.get(cache_key) is creation:
+            del self._pending_creations[cache_key]
+        # Log the failure here, every waiter may have been cancelled before seeing it
+        if not creation.cancelled():
+            error = creation.exception()
+            if error is not None:
+                logger.error(f"Error creating connector {cache_key.connector} for account {cache_key.account}: {error}",
+                             exc_info=error)
+
+    def get_connector_sync(self, account_name: str, connector_name: str) -> Optional[ConnectorBase]:
+        """
+        Get an already initialized connector without creating it.
+        Avoids the coroutine overhead of get_connector for callers that only need cached connectors.
 
-        # Create connector with full initialization
-        connector = await self._create_and_initialize_connector(account_name, connector_name)
-        return connector
+        :param account_name: The name of the account.
+        :param connector_name: The name of the connector.
+        :return: The connector object, or None if it is not initialized.
+        """
+        return self._connector_cache.get(ConnectorKey(account_name, connector_name))
 
-    def _create_connector(self, account_name: str, connector_name: str):
+    async def warm_up(self, accounts_connectors: List[ConnectorKey], max_concurrency: int = 8):
+        """
+        Pre-build connectors so that requests hit the cache instead of paying the initialization cost.
+        Connectors are created concurrently, bounded by max_concurrency.
+
+        :param accounts_connectors: List of (account_name, connector_name) pairs to initialize.
+        :param max_concurrency: Maximum number of connectors initialized at the same time.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        # Load the active orders of every account with one query per account instead of one per connector
+        orders_by_account: Dict[str, Dict[str, List]] = {}
+        if self.db_manager:
+            for account_name in {account_name for account_name, _ in accounts_connectors}:
+                orders_by_account[account_name] = await self._load_active_orders_for_account(account_name)
+
+        async def _warm_up_connector(account_name: str, connector_name: str):
+            preloaded_orders = None
+            if account_name in orders_by_account:
+                preloaded_orders = orders_by_account[account_name].get(connector_name, [])
+            async with semaphore:
+                await self.get_connector(account_name, connector_name, preloaded_orders)
+
+        tasks = [self._track_task(asyncio.create_task(_warm_up_connector(account_name, connector_name)))
+                 for account_name, connector_name in accounts_connectors]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for (account_name, connector_name), result in zip(accounts_connectors, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error initializing connector {connector_name} for account {account_name}: {result}")
+
+    async def _create_connector(self, account_name: str, connector_name: str):
         """
         Create a new connector instance.
         Handles both regular connectors and paper trading connectors.
@@ -65,7 +217,7 @@ class ConnectorManager:
         :param connector_name: The name of the connector.
         :return: The connector object.
         """
-        BackendAPISecurity.login_account(account_name=account_name, secrets_manager=self.secrets_manager)
+        await self._login_account(account_name)
         client_config_map = ClientConfigAdapter(ClientConfigMap())
 
         # Debug logging
@@ -77,6 +229,41 @@ class ConnectorManager:
         else:
             return self._create_regular_connector(connector_name, client_config_map)
 
+    async def _login_account(self, account_name: str):
+        """
+        Log in the account and decrypt its credentials, unless they are already the decrypted ones.
+        BackendAPISecurity only holds the credentials of one account at a time, so consecutive connectors
+        of the same account can skip the keyfile load and decryption.
+        Must be called with the security lock held, the login runs in a thread.
+
+        :param account_name: The name of the account.
+        """
+        login_key = (account_name, id(self.secrets_manager))
+        if self._logged_in == login_key:
+            return
+        self._logged_in = None
+        # Password check and decryption of every credential are blocking, so run them off the event loop
+        if await self._run_security_call(BackendAPISecurity.login_account, account_name=account_name,
+                                         secrets_manager=self.secrets_manager):
+            self._logged_in = login_key
+
+    @staticmethod
+    async def _run_security_call(func, *args, **kwargs):
+        """
+        Run a blocking BackendAPISecurity call in a thread. Must be called with the security lock held.
+        A cancelled caller still waits for the thread to finish, so the lock is never released
+        while the thread is using the decrypted credentials.
+
+        :param func: The BackendAPISecurity function to call.
+        :return: The result of the call.
+        """
+        call = asyncio.ensure_future(asyncio.to_thread(func, *args, **kwargs))
+        try:
+            return await asyncio.shield(call)
+        except asyncio.CancelledError:
+            await asyncio.gather(call, return_exceptions=True)
+            raise
+
     def _create_regular_connector(self, connector_name: str, client_config_map: ClientConfigAdapter):
         """
         Create a regular (live trading) connector instance.
@@ -85,10 +272,11 @@ class ConnectorManager:
         :param client_config_map: Client configuration map.
         :return: The connector object.
         """
-        conn_setting = AllConnectorSettings.get_connector_settings()[connector_name]
+        conn_setting = _conn_settings_for(connector_name)
         keys = BackendAPISecurity.api_keys(connector_name)
 
-        logger.debug(f"API keys retrieved for {connector_name}: {list(keys.keys()) if keys else 'None'}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("API keys retrieved for %s: %s", connector_name, list(keys) if keys else None)
 
         read_only_config = ReadOnlyClientConfigAdapter.lock_config(client_config_map)
 
@@ -99,9 +287,10 @@ class ConnectorManager:
             client_config_map=read_only_config,
         )
 
-        logger.debug(f"Init params keys for {connector_name}: {list(init_params.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Init params keys for %s: %s", connector_name, list(init_params))
 
-        connector_class = get_connector_class(connector_name)
+        connector_class = _get_connector_class_cached(connector_name)
         connector = connector_class(**init_params)
         return connector
 
@@ -116,7 +305,7 @@ class ConnectorManager:
         # Extract base exchange name (remove '_paper_trade' suffix)
         base_exchange_name = connector_name.replace("_paper_trade", "")
         
-        logger.info(f"Creating paper trading connector for base exchange: {base_exchange_name}")
+        logger.info("Creating paper trading connector for base exchange: %s", base_exchange_name)
         
         # Use standard trading pairs for paper trading
         # These can be updated later via _initialize_trading_pair_symbol_map
@@ -135,21 +324,19 @@ class ConnectorManager:
             if paper_trade_config and paper_trade_config.paper_trade_account_balance:
                 for asset, balance in paper_trade_config.paper_trade_account_balance.items():
                     connector.set_balance(asset, float(balance))
-                    logger.debug(f"Set paper trading balance: {asset} = {balance}")
+                    logger.debug("Set paper trading balance: %s = %s", asset, balance)
             
             # Initialize trading rules by accessing the underlying connector
             # Paper trading connectors wrap a real connector that has trading rules
             if hasattr(connector, '_market_data_tracker') and hasattr(connector._market_data_tracker, '_connector_class'):
                 # Access the underlying connector for trading rules
-                logger.debug(f"Paper trading connector wraps: {connector._market_data_tracker._connector_class}")
+                logger.debug("Paper trading connector wraps: %s", connector._market_data_tracker._connector_class)
             
-            logger.info(f"Successfully created paper trading connector {connector_name}")
+            logger.info("Successfully created paper trading connector %s", connector_name)
             return connector
             
-        except Exception as e:
-            logger.error(f"Error creating paper trading connector {connector_name}: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            logger.exception("Error creating paper trading connector %s", connector_name)
             raise
 
     def clear_cache(self, account_name: Optional[str] = None, connector_name: Optional[str] = None):
@@ -160,16 +347,21 @@ class ConnectorManager:
         :param connector_name: If provided with account_name, only clear this specific connector.
         """
         if account_name and connector_name:
-            cache_key = f"{account_name}:{connector_name}"
+            cache_key = ConnectorKey(account_name, connector_name)
             self._connector_cache.pop(cache_key, None)
+            account_connectors = self._by_account.get(account_name)
+            if account_connectors is not None:
+                account_connectors.pop(connector_name, None)
+                if not account_connectors:
+                    del self._by_account[account_name]
         elif account_name:
             # Clear all connectors for this account
-            keys_to_remove = [k for k in self._connector_cache.keys() if k.startswith(f"{account_name}:")]
-            for key in keys_to_remove:
-                self._connector_cache.pop(key)
+            for connector_name in self._by_account.pop(account_name, {}):
+                self._connector_cache.pop(ConnectorKey(account_name, connector_name), None)
         else:
             # Clear entire cache
             self._connector_cache.clear()
+            self._by_account.clear()
 
     @staticmethod
     def get_connector_config_map(connector_name: str):
@@ -179,7 +371,7 @@ class ConnectorManager:
         :param connector_name: The name of the connector.
         :return: The connector config map.
         """
-        connector_config = HummingbotAPIConfigAdapter(AllConnectorSettings.get_connector_config_keys(connector_name))
+        connector_config = HummingbotAPIConfigAdapter(_conn_config_keys_for(connector_name))
         return [key for key in connector_config.hb_config.__fields__.keys() if key != "connector"]
 
     async def update_connector_keys(self, account_name: str, connector_name: str, keys: dict):
@@ -191,16 +383,33 @@ class ConnectorManager:
         :param keys: Dictionary of API keys to update.
         :return: The updated connector instance.
         """
-        BackendAPISecurity.login_account(account_name=account_name, secrets_manager=self.secrets_manager)
-        connector_config = HummingbotAPIConfigAdapter(AllConnectorSettings.get_connector_config_keys(connector_name))
-
-        for key, value in keys.items():
-            setattr(connector_config, key, value)
-
-        BackendAPISecurity.update_connector_keys(account_name, connector_config)
-
-        # Re-decrypt all credentials to ensure the new keys are available
-        BackendAPISecurity.decrypt_all(account_name=account_name)
+        # Keyfile reads/writes and decryption are blocking, so run them off the event loop
+        async with self._security_lock:
+            try:
+                await self._run_security_call(BackendAPISecurity.login_account, account_name=account_name,
+                                              secrets_manager=self.secrets_manager)
+                connector_config = HummingbotAPIConfigAdapter(_conn_config_keys_for(connector_name))
+
+                for key, value in keys.items():
+                    setattr(connector_config, key, value)
+
+                await self._run_security_call(BackendAPISecurity.update_connector_keys, account_name, connector_config)
+                self.invalidate_credentials_cache(account_name)
+                # Updating the keys replaces the connector settings entry, so drop the cached lookups
+                _conn_settings_for.cache_clear()
+                _conn_config_keys_for.cache_clear()
+
+                # Re-decrypt all credentials to ensure the new keys are available
+                await self._run_security_call(BackendAPISecurity.decrypt_all, account_name=account_name)
+            finally:
+                # The decrypted credentials changed, so the next connector creation must log in again.
+                # Reset only once the decryption is done so that no login can be recorded in between.
+                self._logged_in = None
+
+        # Swap the keys into the running connector when possible to avoid a full re-initialization
+        connector = self._connector_cache.get(ConnectorKey(account_name, connector_name))
+        if connector is not None and await self._try_hot_swap_keys(connector, connector_name, keys):
+            return connector
 
         # Clear the cache for this connector to force recreation with new keys
         self.clear_cache(account_name, connector_name)
@@ -210,6 +419,63 @@ class ConnectorManager:
 
         return new_connector
 
+    async def _try_hot_swap_keys(self, connector: ConnectorBase, connector_name: str, keys: dict) -> bool:
+        """
+        Update the credentials of a running connector in place instead of recreating it.
+        Only done for connectors with a known key to attribute mapping in _HOT_SWAP_KEY_ATTRIBUTES,
+        and only when all of their keys are updated. If the new keys fail to validate,
+        the previous credentials are restored and the error is raised.
+
+        :param connector: The cached connector instance.
+        :param connector_name: The name of the connector.
+        :param keys: Dictionary of API keys to update.
+        :return: True if the keys were swapped, False if the connector has to be recreated.
+        """
+        key_attributes = _HOT_SWAP_KEY_ATTRIBUTES.get(connector_name)
+        if key_attributes is None or set(keys) != set(key_attributes):
+            return False
+
+        previous_credentials = {attribute: getattr(connector, attribute) for attribute in key_attributes.values()}
+        await self._apply_connector_credentials(
+            connector, {key_attributes[key]: value for key, value in keys.items()})
+
+        # Validate the new keys
+        try:
+            await connector._update_balances()
+        except Exception:
+            logger.error(f"New keys rejected by {connector_name}, restoring the previous keys of the running connector")
+            await self._apply_connector_credentials(connector, previous_credentials)
+            raise
+
+        logger.info(f"Updated keys of running connector {connector_name}")
+        return True
+
+    async def _apply_connector_credentials(self, connector: ConnectorBase, credentials: Dict[str, str]):
+        """
+        Set the credential attributes of a running connector and rebuild the objects derived from them.
+        The auth, the web assistants factory holding it and the user stream tracker holding both are
+        recreated in the same order as in the connector constructor, then the user stream is restarted.
+
+        :param connector: The running connector instance.
+        :param credentials: Dictionary mapping connector attributes to their new values.
+        """
+        # Stop the user stream before replacing the tracker it runs on
+        user_stream_tasks = [task for task in (connector._user_stream_tracker_task, connector._user_stream_event_listener_task)
+                             if task]
+        for task in user_stream_tasks:
+            task.cancel()
+        await asyncio.gather(*user_stream_tasks, return_exceptions=True)
+
+        for attribute, value in credentials.items():
+            setattr(connector, attribute, value)
+        connector._auth = connector.authenticator
+        connector._web_assistants_factory = connector._create_web_assistants_factory()
+        connector._user_stream_tracker = connector._create_user_stream_tracker()
+
+        connector._user_stream_tracker_task = self._track_task(connector._create_user_stream_tracker_task())
+        connector._user_stream_event_listener_task = self._track_task(
+            safe_ensure_future(connector._user_stream_event_listener()))
+
     def list_account_connectors(self, account_name: str) -> List[str]:
         """
         List all initialized connectors for a specific account.
@@ -217,12 +483,7 @@ class ConnectorManager:
         :param account_name: The name of the account.
         :return: List of connector names.
         """
-        connectors = []
-        for cache_key in self._connector_cache.keys():
-            acc_name, conn_name = cache_key.split(":", 1)
-            if acc_name == account_name:
-                connectors.append(conn_name)
-        return connectors
+        return list(self._by_account.get(account_name, {}))
 
     def get_all_connectors(self) -> Dict[str, Dict[str, ConnectorBase]]:
         """
@@ -230,13 +491,7 @@ class ConnectorManager:
 
         :return: Dictionary mapping account names to their connectors.
         """
-        result = {}
-        for cache_key, connector in self._connector_cache.items():
-            account_name, connector_name = cache_key.split(":", 1)
-            if account_name not in result:
-                result[account_name] = {}
-            result[account_name][connector_name] = connector
-        return result
+        return {account_name: dict(connectors) for account_name, connectors in self._by_account.items()}
 
     def is_connector_initialized(self, account_name: str, connector_name: str) -> bool:
         """
@@ -246,10 +501,11 @@ class ConnectorManager:
         :param connector_name: The name of the connector.
         :return: True if the connector is initialized, False otherwise.
         """
-        cache_key = f"{account_name}:{connector_name}"
+        cache_key = ConnectorKey(account_name, connector_name)
         return cache_key in self._connector_cache
 
-    async def _create_and_initialize_connector(self, account_name: str, connector_name: str) -> ConnectorBase:
+    async def _create_and_initialize_connector(self, account_name: str, connector_name: str,
+                                               preloaded_orders: Optional[List] = None) -> ConnectorBase:
         """
         Create and fully initialize a connector with all necessary setup.
         This includes creating the connector, starting its network, setting up order recording,
@@ -257,46 +513,64 @@ class ConnectorManager:
 
         :param account_name: The name of the account.
         :param connector_name: The name of the connector.
+        :param preloaded_orders: Active order records already fetched from the database (optional).
         :return: The initialized connector instance.
         """
-        cache_key = f"{account_name}:{connector_name}"
+        cache_key = ConnectorKey(account_name, connector_name)
         # Create the base connector
-        connector = self._create_connector(account_name, connector_name)
+        async with self._security_lock:
+            connector = await self._create_connector(account_name, connector_name)
 
         # Handle initialization differently for paper trading vs regular connectors
-        if connector_name.endswith("_paper_trade"):
-            await self._initialize_paper_trading_connector(connector, account_name, connector_name)
-        else:
-            await self._initialize_regular_connector(connector, account_name, connector_name)
+        try:
+            if connector_name.endswith("_paper_trade"):
+                await self._initialize_paper_trading_connector(connector, account_name, connector_name)
+            else:
+                await self._initialize_regular_connector(connector, account_name, connector_name, preloaded_orders)
+        except BaseException:
+            # Failed or cancelled midway, so stop the recorders and network tasks already started
+            await self.stop_connector(account_name, connector_name, connector=connector)
+            raise
 
         self._connector_cache[cache_key] = connector
+        self._by_account.setdefault(account_name, {})[connector_name] = connector
         logger.info(f"Initialized connector {connector_name} for account {account_name}")
         return connector
 
-    async def _initialize_regular_connector(self, connector: ConnectorBase, account_name: str, connector_name: str):
+    async def _initialize_regular_connector(self, connector: ConnectorBase, account_name: str, connector_name: str,
+                                            preloaded_orders: Optional[List] = None):
         """
         Initialize a regular (live trading) connector with full setup.
+        When preloaded_orders is provided, those records are restored instead of querying the database.
         """
-        cache_key = f"{account_name}:{connector_name}"
+        cache_key = ConnectorKey(account_name, connector_name)
         
-        # Initialize symbol map
+        # Initialize symbol map (trading rules depend on it)
         await connector._initialize_trading_pair_symbol_map()
 
-        # Update trading rules
-        await connector._update_trading_rules()
-
-        # Update initial balances
-        await connector._update_balances()
+        is_perpetual = _is_perpetual(connector_name)
 
         # Set default position mode to HEDGE for perpetual connectors
-        if "_perpetual" in connector_name:
+        if is_perpetual:
             if PositionMode.HEDGE in connector.supported_position_modes():
                 connector.set_position_mode(PositionMode.HEDGE)
-            await connector._update_positions()
 
-        # Load existing orders from database before starting network
-        if self.db_manager:
-            await self._load_existing_orders_from_database(connector, account_name, connector_name)
+        # Trading rules, balances, positions and existing orders are independent, so fetch them concurrently.
+        # Existing orders are loaded from the database before starting network.
+        init_steps = {
+            "trading rules": connector._update_trading_rules(),
+            "balances": connector._update_balances(),
+        }
+        if is_perpetual:
+            init_steps["positions"] = connector._update_positions()
+        if preloaded_orders is not None:
+            self._restore_in_flight_orders(connector, preloaded_orders, account_name, connector_name)
+        elif self.db_manager:
+            init_steps["existing orders"] = self._load_existing_orders_from_database(connector, account_name, connector_name)
+
+        errors = await self._gather_and_log(connector_name, init_steps)
+        if errors:
+            raise next(iter(errors.values()))
 
         # Start order tracking if db_manager is available
         if self.db_manager:
@@ -310,7 +584,7 @@ class ConnectorManager:
                 self._orders_recorders[cache_key] = orders_recorder
 
             # Start funding tracking for perpetual connectors
-            if "_perpetual" in connector_name and cache_key not in self._funding_recorders:
+            if is_perpetual and cache_key not in self._funding_recorders:
                 # Import FundingRecorder dynamically to avoid circular imports
                 from services.funding_recorder import FundingRecorder
 
@@ -322,44 +596,45 @@ class ConnectorManager:
         # Start network manually without clock system
         await self._start_connector_network(connector)
         
-        # Perform initial update of connector state
-        await self._update_connector_state(connector, connector_name)
+        # Perform initial update of connector state. Trading rules were just fetched and only change through
+        # REST, while balances and positions are fetched again to cover updates made before the user stream started.
+        await self._update_connector_state(connector, connector_name, update_trading_rules=False)
 
     async def _initialize_paper_trading_connector(self, connector, account_name: str, connector_name: str):
         """
         Initialize a paper trading connector with minimal setup.
         Paper trading connectors are wrappers and don't need the same initialization as regular connectors.
         """
-        cache_key = f"{account_name}:{connector_name}"
+        cache_key = ConnectorKey(account_name, connector_name)
         
         try:
-            logger.info(f"Initializing paper trading connector {connector_name} for account {account_name}")
+            logger.info("Initializing paper trading connector %s for account %s", connector_name, account_name)
             
             # Just verify the connector is ready
-            logger.debug(f"Paper trading connector type: {type(connector)}")
+            logger.debug("Paper trading connector type: %s", type(connector))
             
             # Check if it has the required attributes
-            if hasattr(connector, '_account_balances'):
+            if logger.isEnabledFor(logging.DEBUG) and hasattr(connector, '_account_balances'):
                 balances = getattr(connector, '_account_balances', {})
-                logger.debug(f"Paper trading connector {connector_name} balances: {balances}")
+                logger.debug("Paper trading connector %s balances: %s", connector_name, balances)
             
             # Ensure trading rules are accessible
             # Paper trading connectors should delegate trading rules to their underlying tracker
             if not hasattr(connector, 'trading_rules') or not connector.trading_rules:
-                logger.debug(f"Paper trading connector {connector_name} has no trading rules, checking underlying connector")
+                logger.debug("Paper trading connector %s has no trading rules, checking underlying connector", connector_name)
                 
                 # Try to initialize trading rules from the order book tracker
                 if hasattr(connector, '_order_book_tracker') and connector._order_book_tracker:
                     try:
                         # The order book tracker should have access to trading rules via its connector
                         await connector._order_book_tracker._update_trading_rules()
-                        logger.debug(f"Updated trading rules via order book tracker for {connector_name}")
+                        logger.debug("Updated trading rules via order book tracker for %s", connector_name)
                     except Exception as e:
-                        logger.warning(f"Could not update trading rules via tracker for {connector_name}: {e}")
+                        logger.warning("Could not update trading rules via tracker for %s: %s", connector_name, e)
                 
                 # As a fallback, create a minimal set of trading rules for common pairs
                 if not hasattr(connector, 'trading_rules') or not connector.trading_rules:
-                    logger.warning(f"Creating minimal trading rules for paper trading connector {connector_name}")
+                    logger.warning("Creating minimal trading rules for paper trading connector %s", connector_name)
                     # This will be handled by the place_trade method if needed
 
             # Start order tracking if db_manager is available
@@ -373,17 +648,15 @@ class ConnectorManager:
                         orders_recorder = OrdersRecorder(self.db_manager, account_name, connector_name)
                         orders_recorder.start(connector)
                         self._orders_recorders[cache_key] = orders_recorder
-                        logger.debug(f"Started order recorder for paper trading connector {connector_name}")
+                        logger.debug("Started order recorder for paper trading connector %s", connector_name)
                     except Exception as e:
-                        logger.warning(f"Could not start order recorder for paper trading connector {connector_name}: {e}")
+                        logger.warning("Could not start order recorder for paper trading connector %s: %s", connector_name, e)
                         # Don't fail the entire initialization for order recorder issues
 
-            logger.info(f"Paper trading connector {connector_name} initialized successfully")
+            logger.info("Paper trading connector %s initialized successfully", connector_name)
             
-        except Exception as e:
-            logger.error(f"Error initializing paper trading connector {connector_name}: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            logger.exception("Error initializing paper trading connector %s", connector_name)
             raise
 
     async def _start_connector_network(self, connector: ConnectorBase):
@@ -396,19 +669,23 @@ class ConnectorManager:
             await self._stop_connector_network(connector)
             
             # Start trading rules polling
-            connector._trading_rules_polling_task = safe_ensure_future(connector._trading_rules_polling_loop())
+            connector._trading_rules_polling_task = self._track_task(
+                safe_ensure_future(connector._trading_rules_polling_loop()))
 
             # Start trading fees polling
-            connector._trading_fees_polling_task = safe_ensure_future(connector._trading_fees_polling_loop())
+            connector._trading_fees_polling_task = self._track_task(
+                safe_ensure_future(connector._trading_fees_polling_loop()))
 
             # Start user stream tracker (websocket connection)
-            connector._user_stream_tracker_task = connector._create_user_stream_tracker_task()
+            connector._user_stream_tracker_task = self._track_task(connector._create_user_stream_tracker_task())
 
             # Start user stream event listener
-            connector._user_stream_event_listener_task = safe_ensure_future(connector._user_stream_event_listener())
+            connector._user_stream_event_listener_task = self._track_task(
+                safe_ensure_future(connector._user_stream_event_listener()))
 
             # Start lost orders update task
-            connector._lost_orders_update_task = safe_ensure_future(connector._lost_orders_update_polling_loop())
+            connector._lost_orders_update_task = self._track_task(
+                safe_ensure_future(connector._lost_orders_update_polling_loop()))
 
             logger.info(f"Started connector network tasks for {connector}")
 
@@ -416,80 +693,115 @@ class ConnectorManager:
             logger.error(f"Error starting connector network: {e}")
             raise
 
+    def _track_task(self, task: asyncio.Task) -> asyncio.Task:
+        """
+        Keep a strong reference to a background task until it is done.
+
+        :param task: The task to track.
+        :return: The same task.
+        """
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
     async def _stop_connector_network(self, connector: ConnectorBase):
         """
         Stop connector network tasks.
         """
         try:
-            # Stop trading rules polling
-            if connector._trading_rules_polling_task:
-                connector._trading_rules_polling_task.cancel()
-                connector._trading_rules_polling_task = None
-                
-            # Stop trading fees polling
-            if connector._trading_fees_polling_task:
-                connector._trading_fees_polling_task.cancel()
-                connector._trading_fees_polling_task = None
-                
-            # Stop status polling
-            if connector._status_polling_task:
-                connector._status_polling_task.cancel()
-                connector._status_polling_task = None
-                
-            # Stop user stream tracker
-            if connector._user_stream_tracker_task:
-                connector._user_stream_tracker_task.cancel()
-                connector._user_stream_tracker_task = None
-                
-            # Stop user stream event listener
-            if connector._user_stream_event_listener_task:
-                connector._user_stream_event_listener_task.cancel()
-                connector._user_stream_event_listener_task = None
-                
-            # Stop lost orders update task
-            if connector._lost_orders_update_task:
-                connector._lost_orders_update_task.cancel()
-                connector._lost_orders_update_task = None
+            # Trading rules polling, trading fees polling, status polling, user stream tracker,
+            # user stream event listener and lost orders update task
+            task_attributes = [
+                "_trading_rules_polling_task",
+                "_trading_fees_polling_task",
+                "_status_polling_task",
+                "_user_stream_tracker_task",
+                "_user_stream_event_listener_task",
+                "_lost_orders_update_task",
+            ]
+            tasks = [getattr(connector, attribute) for attribute in task_attributes if getattr(connector, attribute)]
+            for task in tasks:
+                task.cancel()
+
+            # Wait for the cancellations so websockets and sessions are released before returning
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+            for attribute in task_attributes:
+                setattr(connector, attribute, None)
                 
         except Exception as e:
             logger.error(f"Error stopping connector network: {e}")
 
-    async def _update_connector_state(self, connector: ConnectorBase, connector_name: str):
+    async def _update_connector_state(self, connector: ConnectorBase, connector_name: str, update_trading_rules: bool = True):
         """
         Update connector state including balances, orders, positions, and trading rules.
         This function can be called both during initialization and periodically.
+        Right after initialization, trading rules are skipped since they were just fetched.
         """
         try:
-            # Update balances
-            await connector._update_balances()
-            
-            # Update trading rules
-            await connector._update_trading_rules()
-            
+            update_steps = {"balances": connector._update_balances()}
+            if update_trading_rules:
+                update_steps["trading rules"] = connector._update_trading_rules()
+
             # Update positions for perpetual connectors
-            if "_perpetual" in connector_name:
-                await connector._update_positions()
-            
+            if _is_perpetual(connector_name):
+                update_steps["positions"] = connector._update_positions()
+
             # Update order status for in-flight orders
             if hasattr(connector, '_update_order_status') and connector.in_flight_orders:
-                await connector._update_order_status()
-                
+                update_steps["order status"] = connector._update_order_status()
+
+            await self._gather_and_log(connector_name, update_steps)
             logger.debug(f"Updated connector state for {connector_name}")
             
         except Exception as e:
             logger.error(f"Error updating connector state for {connector_name}: {e}")
 
-    async def update_all_connector_states(self):
+    @staticmethod
+    async def _gather_and_log(connector_name: str, steps: Dict[str, Awaitable]) -> Dict[str, Exception]:
+        """
+        Run independent connector coroutines concurrently, logging each failure individually
+        so that one failing step doesn't mask the others.
+
+        :param connector_name: The name of the connector, used for logging.
+        :param steps: Mapping of step description to the awaitable to run.
+        :return: Mapping of failed step description to the exception it raised.
+        """
+        results = await asyncio.gather(*steps.values(), return_exceptions=True)
+        errors = {}
+        for step, result in zip(steps, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error updating {step} for {connector_name}: {result}")
+                errors[step] = result
+        return errors
+
+    async def update_all_connector_states(self, max_concurrent: int = 16, max_concurrent_per_exchange: int = 4):
         """
         Update state for all cached connectors.
         This can be called periodically to refresh connector data.
+        Connectors are updated concurrently, with a per-exchange limit to respect exchange rate limits.
+
+        :param max_concurrent: Maximum number of connectors updated at the same time.
+        :param max_concurrent_per_exchange: Maximum number of connectors of the same exchange updated at the same time.
         """
-        for cache_key, connector in self._connector_cache.items():
-            account_name, connector_name = cache_key.split(":", 1)
-            try:
+        semaphore = asyncio.Semaphore(max_concurrent)
+        exchange_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+        async def _update_with_limits(connector: ConnectorBase, account_name: str, connector_name: str):
+            exchange_semaphore = exchange_semaphores.setdefault(connector_name, asyncio.Semaphore(max_concurrent_per_exchange))
+            async with exchange_semaphore, semaphore:
                 await self._update_connector_state(connector, connector_name)
-            except Exception as e:
-                logger.error(f"Error updating state for {account_name}/{connector_name}: {e}")
+
+        # Snapshot the cache, connectors may be created or removed while the updates run
+        connectors = list(self._connector_cache.items())
+        results = await asyncio.gather(
+            *(_update_with_limits(connector, account_name, connector_name)
+              for (account_name, connector_name), connector in connectors),
+            return_exceptions=True
+        )
+        for ((account_name, connector_name), _), result in zip(connectors, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error updating state for {account_name}/{connector_name}: {result}")
 
     async def _load_existing_orders_from_database(self, connector: ConnectorBase, account_name: str, connector_name: str):
         """
@@ -510,28 +822,66 @@ class ConnectorManager:
                 # Get active orders from database for this account/connector
                 active_orders = await order_repo.get_active_orders(account_name=account_name, connector_name=connector_name)
 
-                logger.info(f"Loading {len(active_orders)} existing active orders for {account_name}/{connector_name}")
+            self._restore_in_flight_orders(connector, active_orders, account_name, connector_name)
 
-                for order_record in active_orders:
-                    try:
-                        # Convert database order to InFlightOrder
-                        in_flight_order = self._convert_db_order_to_in_flight_order(order_record)
-
-                        # Add to connector's in_flight_orders
-                        connector.in_flight_orders[in_flight_order.client_order_id] = in_flight_order
+        except Exception as e:
+            logger.error(f"Error loading existing orders from database for {account_name}/{connector_name}: {e}")
 
-                        logger.debug(f"Loaded order {in_flight_order.client_order_id} from database into connector")
+    async def _load_active_orders_for_account(self, account_name: str) -> Dict[str, List]:
+        """
+        Load the active orders of all connectors of an account with a single query.
 
-                    except Exception as e:
-                        logger.error(f"Error converting database order {order_record.client_order_id} to InFlightOrder: {e}")
-                        continue
+        :param account_name: The name of the account
+        :return: Dictionary mapping connector names to their active order records
+        """
+        try:
+            # Import OrderRepository dynamically to avoid circular imports
+            from database import OrderRepository
 
-                logger.info(
-                    f"Successfully loaded {len(connector.in_flight_orders)} in-flight orders for {account_name}/{connector_name}"
-                )
+            async with self.db_manager.get_session_context() as session:
+                order_repo = OrderRepository(session)
+                return await order_repo.get_active_orders_by_connector(account_name)
 
         except Exception as e:
-            logger.error(f"Error loading existing orders from database for {account_name}/{connector_name}: {e}")
+            logger.error(f"Error loading active orders from database for account {account_name}: {e}")
+            return {}
+
+    def _restore_in_flight_orders(self, connector: ConnectorBase, active_orders: List, account_name: str, connector_name: str):
+        """
+        Add database order records to the connector's in_flight_orders.
+
+        :param connector: The connector instance to load orders into
+        :param active_orders: Active order records from the database
+        :param account_name: The name of the account
+        :param connector_name: The name of the connector
+        """
+        logger.info("Loading %d existing active orders for %s/%s", len(active_orders), account_name, connector_name)
+
+        # Convert database orders to InFlightOrders and add them to connector's in_flight_orders
+        for in_flight_order in self._convert_db_orders_batch(active_orders):
+            connector.in_flight_orders[in_flight_order.client_order_id] = in_flight_order
+            logger.debug("Loaded order %s from database into connector", in_flight_order.client_order_id)
+
+        logger.info(
+            "Successfully loaded %d in-flight orders for %s/%s", len(connector.in_flight_orders), account_name, connector_name
+        )
+
+    def _convert_db_orders_batch(self, order_records: List) -> List[InFlightOrder]:
+        """
+        Convert a batch of database Order records to Hummingbot InFlightOrder objects.
+        Records that fail to convert are logged and skipped.
+
+        :param order_records: Database Order model instances
+        :return: List of InFlightOrder instances
+        """
+        in_flight_orders = []
+        convert = self._convert_db_order_to_in_flight_order
+        for order_record in order_records:
+            try:
+                in_flight_orders.append(convert(order_record))
+            except Exception as e:
+                logger.error("Error converting database order %s to InFlightOrder: %s", order_record.client_order_id, e)
+        return in_flight_orders
 
     def _convert_db_order_to_in_flight_order(self, order_record) -> InFlightOrder:
         """
@@ -540,30 +890,18 @@ class ConnectorManager:
         :param order_record: Database Order model instance
         :return: InFlightOrder instance
         """
-        # Map database status to OrderState
-        status_mapping = {
-            "SUBMITTED": OrderState.PENDING_CREATE,
-            "OPEN": OrderState.OPEN,
-            "PARTIALLY_FILLED": OrderState.PARTIALLY_FILLED,
-            "FILLED": OrderState.FILLED,
-            "CANCELLED": OrderState.CANCELED,
-            "FAILED": OrderState.FAILED,
-        }
-
         # Get the appropriate OrderState
-        order_state = status_mapping.get(order_record.status, OrderState.PENDING_CREATE)
+        order_state = _ORDER_STATUS_MAP.get(order_record.status, OrderState.PENDING_CREATE)
 
         # Convert string enums to proper enum instances
-        try:
-            order_type = OrderType[order_record.order_type]
-        except (KeyError, ValueError):
-            logger.warning(f"Unknown order type '{order_record.order_type}', defaulting to LIMIT")
+        order_type = _ORDER_TYPE_MAP.get(order_record.order_type)
+        if order_type is None:
+            logger.warning("Unknown order type '%s', defaulting to LIMIT", order_record.order_type)
             order_type = OrderType.LIMIT
 
-        try:
-            trade_type = TradeType[order_record.trade_type]
-        except (KeyError, ValueError):
-            logger.warning(f"Unknown trade type '{order_record.trade_type}', defaulting to BUY")
+        trade_type = _TRADE_TYPE_MAP.get(order_record.trade_type)
+        if trade_type is None:
+            logger.warning("Unknown trade type '%s', defaulting to BUY", order_record.trade_type)
             trade_type = TradeType.BUY
 
         # Convert creation timestamp - use order creation time or current time as fallback
@@ -594,63 +932,111 @@ class ConnectorManager:
 
         return in_flight_order
 
-    async def stop_connector(self, account_name: str, connector_name: str):
+    async def stop_connector(self, account_name: str, connector_name: str, log: bool = True,
+                             connector: Optional[ConnectorBase] = None) -> List[str]:
         """
         Stop a connector and its associated services.
+        Services are removed before being stopped, so stopping the same connector twice is a no-op.
 
         :param account_name: The name of the account.
         :param connector_name: The name of the connector.
+        :param log: Whether to log each outcome. Disabled by stop_all_connectors, which logs a summary instead.
+        :param connector: The connector instance if already fetched, otherwise it is looked up in the cache.
+        :return: List of error messages for the services that failed to stop.
         """
-        cache_key = f"{account_name}:{connector_name}"
+        cache_key = ConnectorKey(account_name, connector_name)
+        stopped = []
+        errors = []
 
         # Stop order recorder if exists
-        if cache_key in self._orders_recorders:
+        orders_recorder = self._orders_recorders.pop(cache_key, None)
+        if orders_recorder is not None:
             try:
-                await self._orders_recorders[cache_key].stop()
-                del self._orders_recorders[cache_key]
-                logger.info(f"Stopped order recorder for {account_name}/{connector_name}")
+                await orders_recorder.stop()
+                stopped.append("order recorder")
             except Exception as e:
-                logger.error(f"Error stopping order recorder for {account_name}/{connector_name}: {e}")
+                errors.append(f"Error stopping order recorder for {account_name}/{connector_name}: {e}")
 
         # Stop funding recorder if exists
-        if cache_key in self._funding_recorders:
+        funding_recorder = self._funding_recorders.pop(cache_key, None)
+        if funding_recorder is not None:
             try:
-                await self._funding_recorders[cache_key].stop()
-                del self._funding_recorders[cache_key]
-                logger.info(f"Stopped funding recorder for {account_name}/{connector_name}")
+                await funding_recorder.stop()
+                stopped.append("funding recorder")
             except Exception as e:
-                logger.error(f"Error stopping funding recorder for {account_name}/{connector_name}: {e}")
+                errors.append(f"Error stopping funding recorder for {account_name}/{connector_name}: {e}")
 
         # Stop manual status polling task if exists
-        if cache_key in self._status_polling_tasks:
+        status_polling_task = self._status_polling_tasks.pop(cache_key, None)
+        if status_polling_task is not None:
             try:
-                self._status_polling_tasks[cache_key].cancel()
-                del self._status_polling_tasks[cache_key]
-                logger.info(f"Stopped manual status polling for {account_name}/{connector_name}")
+                status_polling_task.cancel()
+                await asyncio.gather(status_polling_task, return_exceptions=True)
+                stopped.append("manual status polling")
             except Exception as e:
-                logger.error(f"Error stopping manual status polling for {account_name}/{connector_name}: {e}")
+                errors.append(f"Error stopping manual status polling for {account_name}/{connector_name}: {e}")
 
         # Stop connector network if exists
-        if cache_key in self._connector_cache:
+        if connector is None:
+            connector = self._connector_cache.get(cache_key)
+        if connector is not None:
             try:
-                connector = self._connector_cache[cache_key]
                 await self._stop_connector_network(connector)
-                logger.info(f"Stopped connector network for {account_name}/{connector_name}")
+                stopped.append("connector network")
             except Exception as e:
-                logger.error(f"Error stopping connector network for {account_name}/{connector_name}: {e}")
+                errors.append(f"Error stopping connector network for {account_name}/{connector_name}: {e}")
+
+        if log:
+            for service in stopped:
+                logger.info("Stopped %s for %s/%s", service, account_name, connector_name)
+            for error in errors:
+                logger.error(error)
+        return errors
 
     async def stop_all_connectors(self):
         """
         Stop all connectors and their associated services.
+        Outcomes are logged as a single summary instead of per connector.
         """
-        # Get all account/connector pairs
-        pairs = [(k.split(":", 1)[0], k.split(":", 1)[1]) for k in self._connector_cache.keys()]
+        # Cancel the connectors still being created, otherwise they would be cached and started after the drain
+        pending_creations = list(self._pending_creations.values())
+        for creation in pending_creations:
+            creation.cancel()
+        await asyncio.gather(*pending_creations, return_exceptions=True)
+
+        # Drain the cache in one step so each connector is stopped exactly once,
+        # even if another handler stops or clears connectors concurrently
+        connectors = list(self._connector_cache.items())
+        self.clear_cache()
+        pairs = [cache_key for cache_key, _ in connectors]
+
+        # Stop connectors concurrently, bounded to avoid exhausting file descriptors or flooding exchange APIs.
+        # One failure doesn't cancel the others.
+        semaphore = asyncio.Semaphore(self.max_concurrent_stops)
+
+        async def _guarded_stop(account_name: str, connector_name: str, connector: ConnectorBase):
+            async with semaphore:
+                return await self.stop_connector(account_name, connector_name, log=False, connector=connector)
+
+        results = await asyncio.gather(
+            *(_guarded_stop(account_name, connector_name, connector)
+              for (account_name, connector_name), connector in connectors),
+            return_exceptions=True
+        )
+
+        failures = []
+        for (account_name, connector_name), result in zip(pairs, results):
+            if isinstance(result, Exception):
+                failures.append(f"Error stopping connector {connector_name} for account {account_name}: {result}")
+            else:
+                failures.extend(result)
+        failed_connectors = sum(1 for result in results if isinstance(result, Exception) or result)
 
-        # Stop each connector
-        for account_name, connector_name in pairs:
-            await self.stop_connector(account_name, connector_name)
+        logger.info("Stopped %d connectors (%d failed)", len(pairs), failed_connectors)
+        if failures:
+            logger.error("Errors stopping connectors:\n%s", "\n".join(failures))
 
-    def list_available_credentials(self, account_name: str) -> List[str]:
+    async def list_available_credentials(self, account_name: str) -> List[str]:
         """
         List all available connector credentials for an account.
 
@@ -658,7 +1044,33 @@ class ConnectorManager:
         :return: List of connector names that have credentials.
         """
         try:
-            files = fs_util.list_files(f"credentials/{account_name}/connectors")
-            return [file.replace(".yml", "") for file in files if file.endswith(".yml")]
+            # Discovery touches the filesystem, so run it off the event loop
+            return await asyncio.to_thread(fs_util.discover_credentials, account_name)
         except FileNotFoundError:
             return []
+
+    async def list_credentials_for_accounts(self, accounts: List[str], max_concurrency: int = 8) -> Dict[str, List[str]]:
+        """
+        List the available connector credentials of several accounts concurrently.
+
+        :param accounts: The names of the accounts.
+        :param max_concurrency: Maximum number of accounts listed at the same time.
+        :return: Dictionary mapping account names to the connector names that have credentials.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _list_with_limit(account_name: str) -> List[str]:
+            async with semaphore:
+                return await self.list_available_credentials(account_name)
+
+        results = await asyncio.gather(*(_list_with_limit(account_name) for account_name in accounts))
+        return dict(zip(accounts, results))
+
+    @staticmethod
+    def invalidate_credentials_cache(account_name: Optional[str] = None):
+        """
+        Invalidate the cached credentials listing.
+
+        :param account_name: If provided, only invalidate this account.
+        """
+        fs_util.clear_discovery_cache(account_name)
@@ -7,8 +7,9 @@ import os
 logger = logging.getLogger(__name__)
 import shutil
 import sys
+import time
 from pathlib import Path
-from typing import List, Optional, Type
+from typing import Dict, List, Optional, Tuple, Type
 
 import yaml
 from hummingbot.client.config.config_data_types import BaseClientModel
@@ -17,6 +18,17 @@ from hummingbot.strategy_v2.controllers.directional_trading_controller_base impo
 from hummingbot.strategy_v2.controllers.market_making_controller_base import MarketMakingControllerConfigBase
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
 
+# Connector names discovered per credentials directory, with the directory mtime they were listed at
+_discovery_cache: Dict[str, Tuple[int, List[str]]] = {}
+# Credentials directories found missing, with the monotonic time they were checked at
+_missing_dirs_cache: Dict[str, float] = {}
+MISSING_DIR_CACHE_TTL = 5.0
+# Full path of the connector credentials directory per account
+_credentials_dirs: Dict[str, str] = {}
+# Credentials file suffix, with the unbound str.endswith to avoid a method lookup per file
+CREDENTIALS_SUFFIX = ".yml"
+_ends = str.endswith
+
 
 class FileSystemUtil:
     """
@@ -334,6 +346,70 @@ class FileSystemUtil:
         """
         return Path("credentials") / account_name / "connectors" / f"{connector_name}.yml"
 
+    def discover_credentials(self, account_name: str) -> List[str]:
+        """
+        List the names of the connectors that have credentials for an account.
+        Results are cached until the modification time of the credentials directory changes,
+        so all callers listing the same account share a single directory scan.
+        A missing directory is remembered for MISSING_DIR_CACHE_TTL seconds.
+        :param account_name: Name of the account.
+        :return: List of connector names.
+        :raises FileNotFoundError: If the credentials directory does not exist.
+        """
+        dir_path = self._get_credentials_dir(account_name)
+        missing_since = _missing_dirs_cache.get(dir_path)
+        if missing_since is not None and time.monotonic() - missing_since < MISSING_DIR_CACHE_TTL:
+            raise FileNotFoundError(f"Directory '{dir_path}' not found")
+
+        # The directory mtime changes whenever a credentials file is added or removed
+        try:
+            mtime = os.stat(dir_path).st_mtime_ns
+        except FileNotFoundError:
+            _missing_dirs_cache[dir_path] = time.monotonic()
+            _discovery_cache.pop(dir_path, None)
+            raise
+        _missing_dirs_cache.pop(dir_path, None)
+        cached = _discovery_cache.get(dir_path)
+        if cached is not None and cached[0] == mtime:
+            return list(cached[1])
+
+        # os.scandir provides file types from the directory listing instead of one stat per file
+        connector_names = []
+        append = connector_names.append
+        suffix = CREDENTIALS_SUFFIX
+        suffix_length = len(suffix)
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if _ends(name, suffix) and entry.is_file():
+                    append(name[:-suffix_length])
+        _discovery_cache[dir_path] = (mtime, connector_names)
+        return list(connector_names)
+
+    def _get_credentials_dir(self, account_name: str) -> str:
+        """
+        Get the full path of an account's connector credentials directory, formatted once per account.
+        :param account_name: Name of the account.
+        :return: Full path of the credentials directory.
+        """
+        dir_path = _credentials_dirs.get(account_name)
+        if dir_path is None:
+            dir_path = _credentials_dirs[account_name] = self._get_full_path(f"credentials/{account_name}/connectors")
+        return dir_path
+
+    def clear_discovery_cache(self, account_name: Optional[str] = None) -> None:
+        """
+        Clear the cached credentials discovery results.
+        :param account_name: If provided, only clear the cache for this account.
+        """
+        if account_name:
+            dir_path = self._get_credentials_dir(account_name)
+            _discovery_cache.pop(dir_path, None)
+            _missing_dirs_cache.pop(dir_path, None)
+        else:
+            _discovery_cache.clear()
+            _missing_dirs_cache.clear()
+
     def save_model_to_yml(self, yml_path: str, cm: ClientConfigAdapter) -> None:
         """
         Save a ClientConfigAdapter model to a YAML file.
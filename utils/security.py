@@ -28,10 +28,8 @@ class BackendAPISecurity(Security):
     def decrypt_all(cls, account_name: str = "master_account"):
         cls._secure_configs.clear()
         cls._decryption_done.clear()
-        encrypted_files = [file for file in fs_util.list_files(directory=f"credentials/{account_name}/connectors") if
-                           file.endswith(".yml")]
-        for file in encrypted_files:
-            path = Path(fs_util.base_path + f"/credentials/{account_name}/connectors/" + file)
+        for connector_name in fs_util.discover_credentials(account_name):
+            path = Path(fs_util.base_path + f"/credentials/{account_name}/connectors/{connector_name}.yml")
             cls.decrypt_connector_config(path)
         cls._decryption_done.set()
 